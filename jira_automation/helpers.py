@@ -4,19 +4,125 @@ import os
 import re
 import json
 import logging
+import functools
+import hashlib
+import sqlite3
+import time
 from datetime import timedelta, datetime
 import random
 
+try:
+    # Optional C JSON decoder; the stdlib parser is used when not installed.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional linear-time regex engine (google-re2) for scanning ticket
+    # text; the stdlib engine is used when not installed.
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from jira import JIRA, JIRAError
-from collections import Counter
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import json
 from pathlib import Path
 from typing import Any
 from utils.config_loader import load_config_files
 
+# Compiled once at import; _clean_text runs on every field of every issue.
+# The brace-markup, trailing-whitespace and newline-run patterns are fused
+# into one alternation so each field is scanned in a single pass, and every
+# match is simply removed.
+_RE_CLEAN = re.compile(r'\{[^}]*\}|\s+\n|\n{3,}')
+
+# Both DSID formats (d###### and ds###.#) in one alternation so ticket text
+# is scanned once; the named groups say which format matched.
+_RE_DSID = _re_engine.compile(r'\b(?:(?P<d>d\d{6})|ds(?P<a>\d{3})\.(?P<b>\d))\b', _re_engine.IGNORECASE)
+
+# Internal-note templates, defined once instead of rebuilding the long
+# literals inside the per-ticket assignment paths.
+_NOTE_DSID_TMPL = "Ticket assigned to {email} based on DSID ownership. This was done automatically via script. Please @-mention Calie Payne in Jira ticket if help is needed."
+_NOTE_RANDOM_TMPL = "RANDOM ASSIGNMENT: Ticket assigned to {email}. Please reassign if you are not the appropriate person. This was done automatically via script. Please @-mention Calie Payne in Jira ticket if help is needed. "
+
+# Shared session for the GDEX staff API so per-ticket lookups reuse
+# keep-alive connections and retry transient failures with backoff.
+_GDEX_SESSION = requests.Session()
+_GDEX_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# On-disk cache for ticket -> (DSID, owner email) resolution. Both steps are
+# deterministic for a given description, so reruns and retries can skip the
+# regex scan and the staff-API call entirely. Entries are invalidated when
+# the description changes or after the TTL.
+_DSID_CACHE_PATH = '.gdex_cache.sqlite'
+_DSID_CACHE_TTL = 24 * 60 * 60  # seconds
+
+def _dsid_cache_connect():
+    conn = sqlite3.connect(_DSID_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache ("
+        "key TEXT PRIMARY KEY, desc_sha1 BLOB, dsid TEXT, email TEXT, ts INTEGER)"
+    )
+    return conn
+
+def _dsid_cache_lookup(ticket_id: str, desc_sha1: bytes) -> tuple | None:
+    try:
+        with _dsid_cache_connect() as conn:
+            row = conn.execute(
+                "SELECT dsid, email, ts FROM cache WHERE key = ? AND desc_sha1 = ?",
+                (ticket_id, desc_sha1)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logging.warning(f"DSID cache lookup failed for {ticket_id}: {e}")
+        return None
+    if row and time.time() - row[2] <= _DSID_CACHE_TTL:
+        return row[0], row[1]
+    return None
+
+def _dsid_cache_store(ticket_id: str, desc_sha1: bytes, dsid: str, email: str):
+    try:
+        with _dsid_cache_connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, desc_sha1, dsid, email, ts) VALUES (?, ?, ?, ?, ?)",
+                (ticket_id, desc_sha1, dsid, email, int(time.time()))
+            )
+    except sqlite3.Error as e:
+        logging.warning(f"DSID cache store failed for {ticket_id}: {e}")
+
 class GdexJiraAutomator:
+
+    # Only the fields _issue_to_dict actually reads; requesting a subset keeps
+    # search/issue responses small instead of pulling every custom field.
+    _ISSUE_FIELDS = (
+        "summary,description,reporter,created,assignee,"
+        "customfield_10001,customfield_11501,customfield_11600,customfield_12007,"
+        "customfield_11703,customfield_11702,customfield_11504,customfield_10509"
+    )
+
+    # Both unassigned-queue queries, built once instead of per call.
+    _JQL_SERVICE = (
+        'project = "NSF NCAR Research Data Help Desk" '
+        'AND assignee = DATAHELP-SERVICES-CONSULTING '
+        'AND resolution = Unresolved '
+        'ORDER BY key ASC'
+    )
+    _JQL_CURATION = (
+        'project = "NSF NCAR Research Data Help Desk" '
+        'AND assignee = DATAHELP-CURATION-SUPPORT '
+        'AND resolution = Unresolved '
+        'ORDER BY key ASC'
+    )
+
     def __init__(self, config: list = None, production_server: bool = True, dry_run: bool = False):
         self.dry_run = dry_run
 
@@ -64,6 +170,14 @@ class GdexJiraAutomator:
                 f"{'PROD_JIRA_API_TOKEN' if self.production_server else 'TEST_JIRA_API_TOKEN'} is not set in environment variables."
             )
         jira_instance = JIRA(options={'server': self.server}, token_auth=self.jira_api_token, get_server_info=False)
+        # Widen the connection pool and add retries with backoff so keep-alive
+        # sockets are reused across the many per-ticket API calls (and across
+        # threads) instead of paying a TLS handshake each time.
+        jira_instance._session.mount('https://', HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
         return jira_instance
 
     @staticmethod
@@ -76,11 +190,11 @@ class GdexJiraAutomator:
         if not text:
             return None
 
-        cleaned = re.sub(r'\{[^}]*\}', '', text)
-        cleaned = re.sub(r'\s+\n', '', cleaned)
-        cleaned = re.sub(r'\n{3,}', '', cleaned)
-        cleaned = cleaned.strip()
-        return cleaned
+        # Cheap membership checks skip the regex engine entirely for the
+        # common case of fields with no markup or newlines (keys, summaries).
+        if '{' in text or '\n' in text:
+            text = _RE_CLEAN.sub('', text)
+        return text.strip()
 
     def _issue_to_dict(self,issue) -> dict[str, Any]:
 
@@ -89,39 +203,47 @@ class GdexJiraAutomator:
         """
         #print(json.dumps(issue.raw['fields'], indent=2))
 
+        # Bind fields/reporter once; jira-python resolves each attribute
+        # access lazily, so repeating issue.fields per entry costs a
+        # descriptor lookup every time.
+        fields = issue.fields
+        reporter = getattr(fields, 'reporter', None)
+
+        # Keys, emails and timestamps can never carry Jira markup, so they
+        # skip _clean_text; only free-text fields go through the regex.
         field_mapping = {
-        "key": lambda issue: self._clean_text(issue.key),
-        "reporter_name": lambda issue: self._clean_text(issue.fields.reporter.displayName) if issue.fields.reporter else None,
-        "reporter_email": lambda issue: self._clean_text(issue.fields.reporter.emailAddress) if issue.fields.reporter else None,
-        "summary": lambda issue: self._clean_text(issue.fields.summary),
-        "description": lambda issue: self._clean_text(issue.fields.description),
-        "created": lambda issue: self._clean_text(issue.fields.created),
-        "request_type": lambda issue: self._clean_text(issue.fields.customfield_10001.requestType.name),
-        "data_size": lambda issue: issue.fields.customfield_11501.value,
-        "data_size_tb": lambda issue: (issue.fields.customfield_11600 or issue.fields.customfield_12007),
-        "dmss_waived": lambda issue: issue.fields.customfield_11703.value,
-        "dmps_waived": lambda issue: issue.fields.customfield_11702.value,
-        "lab": lambda issue: issue.fields.customfield_11504,
-        "proposal_id": lambda issue: issue.fields.customfield_10509}
-    
+        "key": lambda: issue.key.strip() if issue.key else None,
+        "reporter_name": lambda: self._clean_text(reporter.displayName) if reporter else None,
+        "reporter_email": lambda: reporter.emailAddress.strip() if reporter else None,
+        "summary": lambda: self._clean_text(fields.summary) if fields.summary else None,
+        "description": lambda: self._clean_text(fields.description) if fields.description else None,
+        "created": lambda: fields.created.strip() if fields.created else None,
+        "request_type": lambda: self._clean_text(fields.customfield_10001.requestType.name),
+        "data_size": lambda: fields.customfield_11501.value,
+        "data_size_tb": lambda: (fields.customfield_11600 or fields.customfield_12007),
+        "dmss_waived": lambda: fields.customfield_11703.value,
+        "dmps_waived": lambda: fields.customfield_11702.value,
+        "lab": lambda: fields.customfield_11504,
+        "proposal_id": lambda: fields.customfield_10509}
+
 
         # Construct the dictionary dynamically based on the mapping
         issue_dict = {}
         for field, extractor in field_mapping.items():
             try:
-                issue_dict[field] = extractor(issue)
+                issue_dict[field] = extractor()
             except AttributeError:
                 # Handle any missing or None fields gracefully
                 issue_dict[field] = None
 
         return issue_dict
 
-    def _has_been_assigned_before(self, issue:str) -> dict[str, bool]:
+    def _has_been_assigned_before(self, issue) -> dict[str, bool]:
 
         """
         Check if a JIRA issue has been assigned to DATAHELP-SERVICES-CONSULTING or DATAHELP-CURATION-SUPPORT more than once.
         Args:
-            issue (str): The JIRA issue key.
+            issue: An already-fetched JIRA issue object.
         Returns:
             dict: A dictionary representing the issue.
         """
@@ -129,35 +251,114 @@ class GdexJiraAutomator:
             logging.warning("Cannot check if ticket has been assigned before: Jira Connection not available.")
             return
 
-        try:
-            ticket = self.jira.issue(issue, expand='changelog')
-        except JIRAError as e:
-            logging.error(f"Failed to get Jira changelog for {issue}: {e}")
-            return None
-        
-        history = []
+        ticket = issue
+        if not getattr(ticket, 'changelog', None):
+            # The changelog was not part of the original fetch; pull it alone
+            # (fields='') rather than re-downloading the whole issue.
+            try:
+                ticket = self.jira.issue(issue.key, expand='changelog', fields='')
+            except JIRAError as e:
+                logging.error(f"Failed to get Jira changelog for {issue.key}: {e}")
+                return None
+
+        services_count = curation_count = 0
         for item in ticket.changelog.histories:
             for change in item.items:
                 if change.field == 'assignee':
-                    history.append(change.toString)
-        DATAHELP_count = Counter(history)
-        if DATAHELP_count["DATAHELP-SERVICES-CONSULTING"] > 1 or DATAHELP_count["DATAHELP-CURATION-SUPPORT"] > 1:
-            print(f"Issue {ticket.key} has been assigned before.")
-            ticket_info = [ticket.key, True]
-            print(ticket_info)
-            return ticket_info
-        else:
-            return [ticket.key, True]
+                    if change.toString == 'DATAHELP-SERVICES-CONSULTING':
+                        services_count += 1
+                    elif change.toString == 'DATAHELP-CURATION-SUPPORT':
+                        curation_count += 1
+                    if services_count > 1 or curation_count > 1:
+                        logging.debug(f"Issue {ticket.key} has been assigned before.")
+                        return [ticket.key, True]
+        return [ticket.key, False]
             
+    def _iter_search_issues(self, jql: str, batch_size: int = 500, max_workers: int = 8):
+
+        """
+        Run a paginated JQL search, fetching pages concurrently and yielding
+        issues as each page lands.
+        A one-issue probe reads the total, then startAt windows of batch_size
+        are fetched in parallel so wall-clock is O(pages / max_workers)
+        instead of O(pages), and callers can start per-issue work before the
+        whole result set has been downloaded.
+        Args:
+            jql (str): The JQL query to run.
+            batch_size (int): Page size per request.
+            max_workers (int): Number of concurrent page fetches.
+        Yields:
+            The matching issue objects, in query order.
+        """
+
+        probe = self.jira.search_issues(jql, maxResults=1, fields=self._ISSUE_FIELDS, json_result=True)
+        total = probe.get("total", 0)
+        if total == 0:
+            return
+
+        # expand='changelog' ships each issue's changelog with the search, so
+        # _has_been_assigned_before never needs a follow-up fetch per issue.
+        first_page = self.jira.search_issues(jql, maxResults=batch_size, fields=self._ISSUE_FIELDS, expand='changelog')
+        yield from first_page
+        if not first_page or len(first_page) >= total:
+            return
+
+        # The server may cap pages below the requested batch size; stride the
+        # remaining windows by what it actually returned so nothing is
+        # silently truncated.
+        page_size = len(first_page)
+        if page_size < batch_size:
+            logging.warning(f"Jira capped the search page size at {page_size} (requested {batch_size}).")
+
+        def _fetch_page(start_at: int):
+            return self.jira.search_issues(jql, startAt=start_at, maxResults=page_size, fields=self._ISSUE_FIELDS, expand='changelog')
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map preserves input order, so pages concatenate in query order.
+            for page in executor.map(_fetch_page, range(page_size, total, page_size)):
+                yield from page
+
+    def iter_unassigned_tickets(self, service: bool = True, batch_size: int = 500):
+
+        """
+        Stream unassigned tickets as cleaned dictionaries while search pages
+        are still arriving, so per-ticket processing can begin immediately
+        instead of waiting for the full queue to materialize.
+        Args:
+            service (bool): If True, fetch tickets for Services Consulting; if False, for Curation Support.
+            batch_size (int): Page size passed to the Jira search API.
+        Yields:
+            dict: One cleaned ticket dictionary per unassigned issue.
+        """
+        if not self.jira:
+            logging.warning("Cannot fetch unassigned tickets: Jira Connection not available.")
+            return
+        try:
+            issues = self._iter_search_issues(
+                self._JQL_SERVICE if service else self._JQL_CURATION,
+                batch_size=batch_size
+            )
+            #only yields tickets that have not been assigned before
+            for issue in issues:
+                assigned_before = self._has_been_assigned_before(issue)
+                if assigned_before and assigned_before[1]:
+                    continue
+                yield self._issue_to_dict(issue)
+        except JIRAError as e:
+            logging.error(f"Failed to pull unassigned tickets from Jira: {e}")
+            return
+
     def get_unassigned_tickets(
             self,
-            service:bool=True, ticket_id = None) -> list[dict[str, Any]]:
-        
+            service:bool=True, ticket_id = None, batch_size: int = 500) -> list[dict[str, Any]]:
+
         """
         Fetch unassigned tickets from JIRA for either Services Consulting or Curation Support.
         Args:
             jira_instance (JIRA): The JIRA instance to query.
-            service (bool): If True, fetch tickets for Services Consulting; if False, for Curation Support.    
+            service (bool): If True, fetch tickets for Services Consulting; if False, for Curation Support.
+            batch_size (int): Page size passed to the Jira search API. Larger pages mean
+                fewer round-trips when the unassigned queue is long.
         Returns:
             list[dict]: A list of dictionaries representing unassigned tickets.
         """
@@ -166,28 +367,12 @@ class GdexJiraAutomator:
             return
         if ticket_id:
             try:
-                issue = self.jira.issue(ticket_id)
+                issue = self.jira.issue(ticket_id, fields=self._ISSUE_FIELDS)
                 return self._issue_to_dict(issue)
             except JIRAError as e:
                 logging.error(f"Failed to fetch ticket {ticket_id} from Jira: {e}")
                 return None
-        try:
-            issues = self.jira.search_issues(
-                f'project = "NSF NCAR Research Data Help Desk" '
-                f'AND assignee = DATAHELP-{"SERVICES-CONSULTING" if service else "CURATION-SUPPORT"} '
-                'AND resolution = Unresolved '
-                'ORDER BY key ASC',
-                maxResults=50
-            )
-        except JIRAError as e:
-            logging.error(f"Failed to pull unassigned tickets from Jira: {e}")
-            return None
-        
-        #only stores tickets that have not been assigned before
-        tickets = [self._has_been_assigned_before(issue.key) for issue in issues]
-        #convert to dict
-        tickets = [self._issue_to_dict(issue) for issue in issues]
-        return tickets
+        return list(self.iter_unassigned_tickets(service=service, batch_size=batch_size))
 
     @staticmethod
     def get_dsid_from_json(ticket_text: dict) -> str | None:
@@ -204,28 +389,25 @@ class GdexJiraAutomator:
         if not isinstance(ticket_text, dict):
             raise TypeError(f"Text must be in dict format, got {type(ticket_text).__name__}")
         
-        dsid_patterns = [r'\bd\d{6}\b', r'\bds\d{3}\.\d\b']  # match d + 6 digits as a whole word
-
-        for pattern in dsid_patterns:
-            text = " ".join(map(str, ticket_text.values()))
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                dsid = match.group().lower()
-                # If the format is dsxxx.x, convert to dxxx00x
-                # TODO: Consider dsid conversion to be its own function so it can be used elsewhere
-                if dsid.startswith('ds'):
-                    parts = dsid[2:].split('.')
-                    if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
-                        dsid = f'd{parts[0]}00{parts[1]}'
-                        return dsid
-                else:
-                    return dsid
-        return None
+        text = " ".join(map(str, ticket_text.values()))
+        # Cheap reject: no 'd' anywhere means the regex cannot match, so skip
+        # the engine entirely for tickets that mention no DSID at all.
+        if 'd' not in text and 'D' not in text:
+            return None
+        match = _RE_DSID.search(text)
+        if not match:
+            return None
+        # Group 'd' carries the d###### form; otherwise rewrite dsxxx.x to dxxx00x
+        # TODO: Consider dsid conversion to be its own function so it can be used elsewhere
+        return (match.group('d') or f"d{match.group('a')}00{match.group('b')}").lower()
      
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def get_dsid_owner_email(dsid:str) -> str | None:
         """
         Fetch the staff email for a given DSID from the UCAR GDEX API.
+        Results (including None) are cached per DSID for the lifetime of the
+        run, so tickets referencing the same dataset share one HTTP lookup.
 
         Args:
             dsid (str): The DSID of the staff member.
@@ -242,7 +424,7 @@ class GdexJiraAutomator:
         url = f"https://gdex.ucar.edu/api/get_staff/{dsid}/"
 
         try:
-            response = requests.get(url)
+            response = _GDEX_SESSION.get(url, timeout=(3.05, 10))
             response.raise_for_status()
         except requests.ConnectionError as e:
             logging.error(f"Connection failed when trying to fetch DSID {dsid} from GDEX API: {e}")
@@ -258,25 +440,26 @@ class GdexJiraAutomator:
             return None
 
         try:
-            json_data = response.json()
+            json_data = orjson.loads(response.content) if orjson else response.json()
         except ValueError as e:
-            print(f"Failed to decod JSON for {dsid} from GDEX API: {e}")
+            logging.error(f"Failed to decod JSON for {dsid} from GDEX API: {e}")
             return None
         
         try:
-            if "data" in json_data and json_data["data"]:
-                email = json_data["data"][0].get("email")
-                if not email:
-                    print(f"No email found for DSID {dsid} in GDEX API response")
-                return email
-            else:
-                print(f"No staff data returned for DSID {dsid} from GDEX API: {e}")
+            # Only data[0].email is needed from the payload; grab it directly.
+            data = json_data.get("data")
+            if not data:
+                logging.warning(f"No staff data returned for DSID {dsid} from GDEX API")
                 return None
+            email = data[0].get("email")
+            if not email:
+                logging.warning(f"No email found for DSID {dsid} in GDEX API response")
+            return email
         except (KeyError, TypeError) as e:
-            print(f"Unexpected data structure for {dsid} via GDEX API: {e}")
+            logging.error(f"Unexpected data structure for {dsid} via GDEX API: {e}")
             return None
         except Exception as e:
-            print(f"Unexpected error processing DSID {dsid} data via GDEX API: {e}")
+            logging.error(f"Unexpected error processing DSID {dsid} data via GDEX API: {e}")
             return None
 
     def add_comment_to_ticket(self, ticket_id: str, comment: str):
@@ -343,29 +526,111 @@ class GdexJiraAutomator:
         
         try:
             self.jira.assign_issue(ticket_id, email)
-            print(f"Successfully assigned ticket {ticket_id} to {email}")
+            logging.info(f"Successfully assigned ticket {ticket_id} to {email}")
             self.add_internal_note_to_ticket(ticket_id, note)
         except JIRAError as e:
             logging.error(f"JIRA API error when assigning {ticket_id}: {e}")
         except Exception as e:
             logging.error(f"Unexpected error assigning {ticket_id} to {email}: {e}")
 
-    def assign_by_dsid(self, ticket: dict):
+    def resolve_assignee_by_dsid(self, ticket: dict) -> str | None:
+        """
+        Resolve the DSID owner email for a ticket without assigning it.
+        Args:
+            ticket (dict): A cleaned ticket dictionary.
+        Returns:
+            str: The owner email, or None if no DSID/owner was found.
+        """
         ticket_id = ticket.get("key")
-        print(f"Processing ticket {ticket_id} for assignment ...")
+        desc_sha1 = hashlib.sha1((ticket.get("description") or "").encode()).digest()
+        cached = _dsid_cache_lookup(ticket_id, desc_sha1)
+        if cached:
+            return cached[1]
         dsid = self.get_dsid_from_json(ticket)
-        if not dsid: 
+        if not dsid:
+            return None
+        email = self.get_dsid_owner_email(dsid)
+        if email:
+            _dsid_cache_store(ticket_id, desc_sha1, dsid, email)
+        return email
+
+    def assign_by_dsid(self, ticket: dict):
+        ticket_id = ticket.get("key")
+        logging.debug(f"Processing ticket {ticket_id} for assignment ...")
+        email = self.resolve_assignee_by_dsid(ticket)
+        if not email:
             self.assign_by_random(ticket_id)
             return
-        email = self.get_dsid_owner_email(dsid)
-        note = f"Ticket assigned to {email} based on DSID ownership. This was done automatically via script. Please @-mention Calie Payne in Jira ticket if help is needed."
+        note = _NOTE_DSID_TMPL.format(email=email)
         self.assign_jira_ticket(ticket_id, email, note)
 
+    def bulk_assign_tickets(self, email: str, ticket_ids: list[str], note: str):
+        """
+        Assign several tickets to the same user with one bulk API call.
+        Falls back to per-ticket assignment when the bulk endpoint is
+        unavailable or rejects the request.
+        Args:
+            email (str): The email of the user to assign the tickets to.
+            ticket_ids (list): The ticket keys to assign.
+            note (str): Internal note added to each assigned ticket.
+        Returns:
+            None
+        """
+        if self.dry_run == True:
+            print(f"[DRY_RUN] Would assign {', '.join(ticket_ids)} to {email}")
+            return
+
+        payload = {
+            "issueUpdates": [
+                {"issueIdOrKey": ticket_id, "update": {"assignee": [{"set": {"name": email}}]}}
+                for ticket_id in ticket_ids
+            ]
+        }
+        try:
+            response = self.jira._session.post(f"{self.server}/rest/api/2/bulk", json=payload)
+            response.raise_for_status()
+        except (JIRAError, requests.RequestException) as e:
+            logging.warning(f"Bulk assign unavailable ({e}); falling back to per-ticket assignment.")
+            for ticket_id in ticket_ids:
+                self.assign_jira_ticket(ticket_id, email, note)
+            return
+        logging.info(f"Successfully assigned tickets {', '.join(ticket_ids)} to {email}")
+        # Notes stay per-ticket so each issue's history shows why it was assigned.
+        for ticket_id in ticket_ids:
+            self.add_internal_note_to_ticket(ticket_id, note)
+
+    def bulk_assign_by_dsid(self, tickets) -> int:
+        """
+        Resolve DSID owners for a batch of tickets concurrently, then assign
+        them grouped by owner so each unique assignee costs one bulk call
+        instead of one call per ticket. Tickets with no resolvable owner are
+        randomly assigned as before.
+        Args:
+            tickets: An iterable of cleaned ticket dictionaries.
+        Returns:
+            int: The number of tickets processed.
+        """
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            resolved = [(ticket, executor.submit(self.resolve_assignee_by_dsid, ticket))
+                        for ticket in tickets]
+            assignee_to_keys = defaultdict(list)
+            for ticket, future in resolved:
+                email = future.result()
+                ticket_id = ticket.get("key")
+                if email:
+                    assignee_to_keys[email].append(ticket_id)
+                else:
+                    self.assign_by_random(ticket_id)
+        for email, ticket_ids in assignee_to_keys.items():
+            note = _NOTE_DSID_TMPL.format(email=email)
+            self.bulk_assign_tickets(email, ticket_ids, note)
+        return len(resolved)
+
     def assign_by_random(self, ticket_id):
         random_assignees = ["caliepayne@ucar.edu", "davestep@ucar.edu", "dattore@ucar.edu", "rpconroy@ucar.edu", "tcram@ucar.edu", "chiaweih@ucar.edu"]
         random_email = random.choice(random_assignees)
-        print(f"Randomly assigned {ticket_id} to {random_email}")
-        note = f"RANDOM ASSIGNMENT: Ticket assigned to {random_email}. Please reassign if you are not the appropriate person. This was done automatically via script. Please @-mention Calie Payne in Jira ticket if help is needed. "
+        logging.info(f"Randomly assigned {ticket_id} to {random_email}")
+        note = _NOTE_RANDOM_TMPL.format(email=random_email)
         self.assign_jira_ticket(ticket_id, random_email, note)
     
     def assign_by_dsrqst(self, ticket: dict):
@@ -385,7 +650,7 @@ class GdexJiraAutomator:
                 'AND priority != Hold'
             )
             if not curation_issues:
-                print("No stale issues.")
+                logging.info("No stale issues.")
 
         except JIRAError as e:
             logging.error(f"Failed to pull stale tickets from Jira: {e}")
@@ -405,11 +670,11 @@ class GdexJiraAutomator:
 
                 if "JIRA_AUTO__STALE_TICKET" in comment_body and date>= expired_time:
                     transitions = self.jira.transitions(ticket)
-                    print(ticket)
+                    logging.debug(ticket)
                     for t in transitions:
                         if "resolved" in t["name"]:
                             resolved_transition = t["id"]
-                            print(f"Ticket {ticket} transitioned to Resolved (transition id: {resolved_transition})")
+                            logging.info(f"Ticket {ticket} transitioned to Resolved (transition id: {resolved_transition})")
                             self.jira.transition_issue(ticket, t["id"])
                             message = "[JIRA_AUTO__CLOSE_TICKET] -- Ticket closure due to this ticket being inactive for more than 20 days."
                             self.add_comment_to_ticket(issue.key,comment= message)
@@ -431,7 +696,7 @@ class GdexJiraAutomator:
                 'AND updated <= -14d' 
             )
             if not stale_issues:
-                print("No stale issues.")
+                logging.info("No stale issues.")
 
         except JIRAError as e:
             logging.error(f"Failed to pull stale tickets from Jira: {e}")
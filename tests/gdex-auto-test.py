@@ -11,14 +11,13 @@
 # if __name__ == "__main__":
 #     main()
 
-import re 
+# DSID extraction lives in jira_automation.helpers; import it from there
+# instead of redefining the patterns here.
+import sys
+from pathlib import Path
 
-text ="D609000"
-dsid_patterns = [r'\bd\d{6}\b', r'\bds\d{3}\.\d\b']
-for pattern in dsid_patterns:
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        dsid = match.group().lower()
-        print(dsid)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from jira_automation.helpers import GdexJiraAutomator
 
+print(GdexJiraAutomator.get_dsid_from_json({"description": "D609000"}))
@@ -1,7 +1,9 @@
 import yaml
 import logging
+import functools
 
-def load_config_files(config_files: list = None) -> dict:
+@functools.lru_cache(maxsize=None)
+def _load_config_files_cached(config_files: tuple) -> dict:
     configs = {}
     for file_path in config_files:
         try:
@@ -19,3 +21,11 @@ def load_config_files(config_files: list = None) -> dict:
         except Exception as e:
             logging.error(f"Unexpected error while loading config file {file_path}. Error: {e}")
     return(configs)
+
+def load_config_files(config_files: list = None) -> dict:
+    # Parsed configs are cached per path tuple, so repeated calls skip the
+    # disk read and YAML parse. Call reload_config_files() to force a reload.
+    return _load_config_files_cached(tuple(config_files or ()))
+
+def reload_config_files():
+    _load_config_files_cached.cache_clear()
@@ -5,7 +5,9 @@ import requests
 from PyPDF2 import PdfReader, PdfWriter
 
 def download_pdf(url, filename):
-    response = requests.get(url)
+    # Bounded timeout so a hung server cannot stall the event run.
+    response = requests.get(url, timeout=(3.05, 30))
+    response.raise_for_status()
     with open(filename, "wb") as f:
         f.write(response.content)
 